@@ -1,7 +1,109 @@
+import functools
 import numpy as np
-from scipy.optimize import newton
-from math import log, sqrt, exp
-from scipy.stats import norm
+from math import log, log1p, sqrt, exp, expm1, erfc, pi
+
+_SQRT2 = sqrt(2.0)
+
+# Argument types routed to the vectorized option pricer. This is much cheaper
+# than np.ndim, which matters on the scalar path.
+_ARRAY_TYPES = (np.ndarray, list, tuple)
+
+# Pure scalar pricing functions memoize this many recent argument tuples.
+_CACHE_SIZE = 4096
+
+# Lists up to this length are evaluated with a generated Horner kernel, which beats
+# the fixed cost of converting to a numpy array and dispatching the reduction.
+_SHORT_CASH_FLOWS = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _horner_kernel(n):
+    """
+    Generate a Horner kernel specialized to exactly n cash flows.
+    The recurrence is unrolled into straight-line code, so a horizon reused
+    across many calls pays no per-element loop overhead.
+    :param n: Number of cash flows (at most _SHORT_CASH_FLOWS).
+    :return: A function (cash_flows, rate) -> (NPV, derivative of NPV with respect to the rate).
+    """
+    # With x = 1/(1+r), NPV is the polynomial P(x) = sum(cf_t * x**t) and dNPV/dr = -x**2 * P'(x).
+    # Each Horner step is slope = slope * x + value; value = value * x + cf_t, from t = n-1 down to 0.
+    lines = ["def kernel(cash_flows, rate):"]
+    if n:
+        lines.append("    " + ", ".join(f"c{t}" for t in range(n)) + ", = cash_flows")
+    lines.append("    x = 1.0 / (1.0 + rate)")
+    lines.append(f"    value = c{n - 1} + 0.0" if n else "    value = 0.0")
+    lines.append("    slope = 0.0")
+    for t in range(n - 2, -1, -1):
+        lines.append("    slope = slope * x + value")
+        lines.append(f"    value = value * x + c{t}")
+    lines.append("    return value, -x * x * slope")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["kernel"]
+
+
+def _npv_horner(cash_flows, rate):
+    """
+    NPV and its derivative for a short list of cash flows via Horner's scheme, without validation.
+    :param cash_flows: A list of cash flows; array elements (one per period) are valued per column.
+    :param rate: The discount rate as a decimal (must not be -1).
+    :return: Tuple of (NPV, derivative of NPV with respect to the rate).
+    """
+    return _horner_kernel(len(cash_flows))(cash_flows, rate)
+
+
+@functools.lru_cache(maxsize=64)
+def _periods(n):
+    """
+    Read-only float64 period indices 0..n-1, cached per horizon.
+    """
+    periods = np.arange(n, dtype=np.float64)
+    periods.flags.writeable = False
+    return periods
+
+
+def _npv_arr(cf, rate):
+    """
+    Net Present Value of a float64 array of cash flows, without validation.
+    :param cf: A numpy float64 array of cash flows, one row per period; extra
+        axes (e.g. one column per scenario) are valued independently.
+    :param rate: The discount rate as a decimal (must not be -1).
+    :return: Net present value of the cash flows, or an array of them for multi-dimensional input.
+    """
+    discount = np.exp(_periods(len(cf)) * -log1p(rate))
+    value = cf.T @ discount
+    return float(value) if cf.ndim == 1 else value
+
+
+def _npv_deriv_arr(cf, tcf, rate):
+    """
+    Derivative of NPV with respect to the rate, without validation.
+    :param cf: A numpy float64 array of cash flows, one row per period.
+    :param tcf: The cash flows weighted by their period along the first axis.
+    :param rate: The discount rate as a decimal (must not be -1).
+    :return: Derivative of NPV with respect to the rate, or an array of them for multi-dimensional input.
+    """
+    # d/dr sum(cf_t * x**t) with x = 1/(1+r) is -1/(1+r) * sum(t * cf_t * x**t)
+    discount = np.exp(_periods(len(cf)) * -log1p(rate))
+    value = -(tcf.T @ discount) / (1 + rate)
+    return float(value) if cf.ndim == 1 else value
+
+
+def _npv_and_deriv(flows, periods, rate):
+    """
+    NPV and its derivative with respect to the rate in a single pass, without validation.
+    :param flows: A (2, n) float64 array whose rows are the cash flows and
+        the cash flows weighted by their period.
+    :param periods: The period indices, ``np.arange(n)`` as float64.
+    :param rate: The discount rate as a decimal (must not be -1).
+    :return: Tuple of (NPV, derivative of NPV with respect to the rate).
+    """
+    discount = np.exp(periods * -log1p(rate))
+    value, weighted = flows @ discount
+    return float(value), -float(weighted) / (1 + rate)
+
+
 def npv(rate, cash_flows):
     """
     Calculates the Net Present Value of a series of cash flows
@@ -13,10 +115,11 @@ def npv(rate, cash_flows):
         raise TypeError("Cash flows must be a list or numpy array.")
     if rate < -1:
         raise ValueError("Rate must be greater than or equal to -1.")
-    try:
-        return sum(cf / (1 + rate) ** t for t, cf in enumerate(cash_flows))
-    except ZeroDivisionError:
+    if rate == -1:
         raise ValueError("Rate cannot be -1.")
+    if isinstance(cash_flows, list) and len(cash_flows) <= _SHORT_CASH_FLOWS:
+        return _npv_horner(cash_flows, rate)[0]
+    return _npv_arr(np.asarray(cash_flows, dtype=np.float64), rate)
 
 
 def npv_derivative(rate, cash_flows):
@@ -34,10 +137,12 @@ def npv_derivative(rate, cash_flows):
         raise TypeError("Cash flows must be a list or numpy array.")
     if rate < -1:
         raise ValueError("Rate must be greater than or equal to -1.")
-    try:
-        return sum(-t * cf / (1 + rate) ** (t + 1) for t, cf in enumerate(cash_flows))
-    except ZeroDivisionError:
+    if rate == -1:
         raise ValueError("Rate cannot be -1.")
+    if isinstance(cash_flows, list) and len(cash_flows) <= _SHORT_CASH_FLOWS:
+        return _npv_horner(cash_flows, rate)[1]
+    cf = np.asarray(cash_flows, dtype=np.float64)
+    return _npv_deriv_arr(cf, (cf.T * _periods(len(cf))).T, rate)
 
 
 def internal_rate_of_return(cash_flows, initial_guess=0.1, tolerance=1e-6, max_iterations=1000):
@@ -62,10 +167,21 @@ def internal_rate_of_return(cash_flows, initial_guess=0.1, tolerance=1e-6, max_i
     if max_iterations <= 0:
         raise ValueError("Maximum iterations must be a positive integer.")
 
+    # Everything that does not depend on the rate is built once, outside the Newton loop
+    if isinstance(cash_flows, list) and len(cash_flows) <= _SHORT_CASH_FLOWS:
+        kernel, args = _horner_kernel(len(cash_flows)), (cash_flows,)
+    else:
+        cf = np.asarray(cash_flows, dtype=np.float64)
+        if cf.ndim != 1:
+            raise ValueError("Cash flows must be one-dimensional.")
+        periods = _periods(cf.size)
+        kernel, args = _npv_and_deriv, (np.vstack((cf, periods * cf)), periods)
+
     rate = initial_guess
     for i in range(max_iterations):
-        npv_value = npv(rate, cash_flows)
-        npv_deriv = npv_derivative(rate, cash_flows)
+        if rate <= -1:
+            raise ValueError("Rate must be greater than -1.")
+        npv_value, npv_deriv = kernel(*args, rate)
 
         if npv_deriv == 0:
             raise ZeroDivisionError("Derivative is zero; unable to continue iteration.")
@@ -83,6 +199,7 @@ def internal_rate_of_return(cash_flows, initial_guess=0.1, tolerance=1e-6, max_i
 def present_value(rate, future_value, periods):
     """
     Calculates present value of future asset.
+    Scalar calls are memoized; numpy array amounts are computed directly.
     :param rate: Discount rate.
     :param future_value: Future value.
     :param periods: Number of periods of compounding
@@ -92,14 +209,26 @@ def present_value(rate, future_value, periods):
         raise ValueError("Periods cannot be negative.")
     if rate < 0:
         raise ValueError("Rate cannot be negative.")
-    try:
-        return future_value / (1 + rate) ** periods
-    except ZeroDivisionError:
-        raise ValueError("Rate cannot be -1.")
+    if isinstance(rate, np.ndarray) or isinstance(future_value, np.ndarray) or isinstance(periods, np.ndarray):
+        return _present_value(rate, future_value, periods)
+    return _present_value_cached(rate, future_value, periods)
+
+
+def _present_value(rate, future_value, periods):
+    """
+    Present value without validation.
+    """
+    # exp/log1p is cheaper than pow and stays accurate for rates near zero
+    return future_value * exp(-periods * log1p(rate))
+
+
+_present_value_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_present_value)
+
 
 def future_value(rate, present_value, periods):
     """
     Calculates future value of an asset
+    Scalar calls are memoized; numpy array amounts are computed directly.
     :param rate: Interest rate
     :param present_value: Current value of asset.
     :param periods: Periods of compounding
@@ -110,19 +239,32 @@ def future_value(rate, present_value, periods):
     if rate < 0:
         raise ValueError("Rate cannot be negative.")
     try:
-        return present_value * ((1 + rate) ** periods)
+        if isinstance(rate, np.ndarray) or isinstance(present_value, np.ndarray) or isinstance(periods, np.ndarray):
+            return _future_value(rate, present_value, periods)
+        return _future_value_cached(rate, present_value, periods)
     except OverflowError:
         raise ValueError("Result is too large to handle.")
 
 
+def _future_value(rate, present_value, periods):
+    """
+    Future value without validation.
+    """
+    return present_value * exp(periods * log1p(rate))
+
+
+_future_value_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_future_value)
+
+
 def bond_price(face_value, coupon_rate, periods, discount_rate):
     """
     Calculate the price of a bond.
+    Scalar calls are memoized; numpy array arguments are priced directly.
     :param face_value: Face value of the bond.
     :param coupon_rate: The annual coupon rate as a decimal.
     :param periods: # of periods until maturity.
     :param discount_rate: The discount rate as a decimal.
-    :return: The bond price as a float.
+    :return: The bond price as a float, or a numpy array of prices for array inputs.
     """
     if face_value <= 0:
         raise ValueError("Face value must be positive.")
@@ -133,13 +275,87 @@ def bond_price(face_value, coupon_rate, periods, discount_rate):
     if discount_rate < 0:
         raise ValueError("Discount rate cannot be negative.")
 
+    if (isinstance(face_value, np.ndarray) or isinstance(coupon_rate, np.ndarray)
+            or isinstance(periods, np.ndarray) or isinstance(discount_rate, np.ndarray)):
+        return _bond_price_arr(face_value, coupon_rate, periods, discount_rate)
+    return _bond_price_cached(face_value, coupon_rate, periods, discount_rate)
+
+
+def _bond_price(face_value, coupon_rate, periods, discount_rate):
+    """
+    Bond price without validation; any discount rate greater than -1 is accepted.
+    :param face_value: Face value of the bond.
+    :param coupon_rate: The annual coupon rate as a decimal.
+    :param periods: # of periods until maturity.
+    :param discount_rate: The discount rate as a decimal.
+    :return: The bond price as a float.
+    """
     coupon = face_value * coupon_rate
-    try:
-        price = sum(coupon / (1 + discount_rate) ** t for t in range(1, periods + 1))
-        price += face_value / (1 + discount_rate) ** periods
-        return price
-    except ZeroDivisionError:
-        raise ValueError("Discount rate cannot be -1.")
+    if discount_rate == 0:
+        return coupon * periods + face_value
+    # Closed-form present value of the coupon annuity plus the discounted face value.
+    # expm1 gives 1 - df without cancellation, so small rates stay accurate.
+    growth = -periods * log1p(discount_rate)
+    return coupon * -expm1(growth) / discount_rate + face_value * exp(growth)
+
+
+_bond_price_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_bond_price)
+
+
+def _bond_price_arr(face_value, coupon_rate, periods, discount_rate):
+    """
+    Closed-form bond prices for numpy array inputs, without validation.
+    :return: A numpy array of bond prices.
+    """
+    zero_rate = discount_rate == 0
+    growth = -periods * np.log1p(discount_rate)
+    # expm1 gives 1 - df without cancellation, so small rates stay accurate
+    annuity = np.where(zero_rate, periods, -np.expm1(growth) / np.where(zero_rate, 1.0, discount_rate))
+    return face_value * coupon_rate * annuity + face_value * np.exp(growth)
+
+
+def _solve_decreasing(func, fprime, x0, lower, upper, tolerance, max_iterations):
+    """
+    Find the root of a strictly decreasing function with Newton's method,
+    safeguarded by bisection as in Numerical Recipes' rtsafe: every evaluation
+    narrows [lower, upper] around the root, and a Newton step that would leave
+    it, or that fails to halve the step before last, is replaced by the midpoint.
+    :param func: The function whose root is sought.
+    :param fprime: Derivative of func.
+    :param x0: Starting point inside (lower, upper).
+    :param lower: A point where func is positive.
+    :param upper: A point where func is negative.
+    :param tolerance: Stop once successive iterates differ by less than this.
+    :param max_iterations: The maximum number of iterations to perform.
+    :return: The root.
+    """
+    x = x0
+    step = step_before_last = upper - lower
+    for i in range(max_iterations):
+        fx = func(x)
+        if fx > 0:
+            lower = x
+        elif fx < 0:
+            upper = x
+        else:
+            return x
+
+        step_before_last = step
+        step = fx / fprime(x)
+        new_x = x - step
+        # A Newton step crawling along a steep or flat stretch shrinks by less than
+        # half per iteration; bisect instead so the bracket keeps collapsing
+        if not lower < new_x < upper or abs(step) > 0.5 * abs(step_before_last):
+            new_x = 0.5 * (lower + upper)
+            step = x - new_x
+
+        if abs(new_x - x) < tolerance:
+            return new_x
+
+        x = new_x
+
+    raise RuntimeError(f"Root finding did not converge after {max_iterations} iterations.")
+
 
 def yield_to_maturity(face_value, coupon_rate, periods, price):
     """
@@ -159,13 +375,39 @@ def yield_to_maturity(face_value, coupon_rate, periods, price):
     if price <= 0:
         raise ValueError("Price must be positive.")
 
+    coupon = face_value * coupon_rate
+
     def bond_price_diff(rate):
-        return bond_price(face_value, coupon_rate, periods, rate) - price
+        return _bond_price(face_value, coupon_rate, periods, rate) - price
+
+    def bond_price_deriv(rate):
+        if rate == 0:
+            return -coupon * periods * (periods + 1) / 2 - periods * face_value
+        growth = -periods * log1p(rate)
+        df = exp(growth)
+        # expm1(growth) is -(1 - df) without cancellation for rates near zero
+        return (coupon * expm1(growth) / rate ** 2
+                + periods * (coupon / rate - face_value) * df / (1 + rate))
+
+    # Price is strictly decreasing in the yield, so bracket the root between a
+    # yield priced above the target and one priced below it. The lower end is
+    # kept where the discount factor (1 + rate) ** -periods still fits in a float.
+    lower = max(-0.99, 10.0 ** (-300.0 / periods) - 1)
+    upper = 10.0
+    if bond_price_diff(lower) <= 0:
+        raise ValueError("Price is too high for the yield to be solved.")
+    while bond_price_diff(upper) > 0:
+        upper *= 10
+
+    # Standard approximate-YTM formula as the starting point
+    x0 = (coupon + (face_value - price) / periods) / ((face_value + price) / 2)
+    if not lower < x0 < upper:
+        x0 = 0.5 * (lower + upper)
 
     try:
-        return newton(bond_price_diff, x0=0.05)
+        return _solve_decreasing(bond_price_diff, bond_price_deriv, x0, lower, upper, 1e-10, 100)
     except RuntimeError:
-        raise ValueError("Newton-Raphson method failed to converge.")
+        raise ValueError("Yield to maturity solver failed to converge.")
 
 
 def dividend_discount_model(dividend, growth_rate, discount_rate):
@@ -183,22 +425,83 @@ def dividend_discount_model(dividend, growth_rate, discount_rate):
     if discount_rate <= 0:
         raise ValueError("Discount rate must be positive.")
 
-    try:
-        return dividend / (discount_rate - growth_rate)
-    except ZeroDivisionError:
-        raise ValueError("Discount rate must be greater than the growth rate.")
+    return dividend / (discount_rate - growth_rate)
+
+
+def _Phi(x):
+    """
+    Standard normal cumulative distribution function.
+    :param x: The point at which to evaluate the CDF.
+    :return: P(Z <= x) for a standard normal Z.
+    """
+    # erfc keeps full relative accuracy in the left tail, unlike 0.5 * (1 + erf(x / sqrt(2)))
+    return 0.5 * erfc(-x / _SQRT2)
+
+
+def _check_black_scholes_arr(S, K, T, r, sigma):
+    """
+    Validate array Black-Scholes inputs elementwise, raising ValueError on the first bad field.
+    """
+    if np.any(S <= 0) or np.any(K <= 0):
+        raise ValueError("Stock price and strike price must be positive.")
+    if np.any(T <= 0):
+        raise ValueError("Time to maturity must be positive.")
+    if np.any(r < 0):
+        raise ValueError("Risk-free rate cannot be negative.")
+    if np.any(sigma <= 0):
+        raise ValueError("Volatility must be positive.")
+
+
+def _black_scholes_call_vec(S, K, T, r, sigma):
+    """
+    Black-Scholes call prices for numpy array inputs, without validation.
+    :return: A numpy array of call option prices.
+    """
+    # Imported lazily so that loading the module does not pull in SciPy
+    from scipy.special import ndtr
+
+    vol = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol
+    d2 = d1 - vol
+    return S * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
 
 
-def black_scholes_call(S, K, T, r, sigma):
+def _black_scholes_call_arr(S, K, T, r, sigma, dtype=None):
+    """
+    Vectorized Black-Scholes call price for array-like inputs.
+    :param S: Current stock prices.
+    :param K: Option strike prices.
+    :param T: Times to maturity.
+    :param r: Risk-free interest rates as decimals.
+    :param sigma: Volatilities of the underlying stocks.
+    :param dtype: Floating dtype to compute in, or None to keep the inputs' dtypes.
+    :return: A numpy array of call option prices.
+    """
+    S, K, T, r, sigma = (np.asarray(a, dtype=dtype) for a in (S, K, T, r, sigma))
+    _check_black_scholes_arr(S, K, T, r, sigma)
+    return _black_scholes_call_vec(S, K, T, r, sigma)
+
+
+def black_scholes_call(S, K, T, r, sigma, dtype=None):
     """
     Calculate the call option price using the Black-Scholes model.
+    Any argument may be an array, in which case the prices of the whole
+    (broadcast) book are computed in one vectorized pass. Scalar calls are
+    memoized, so repeated queries with the same inputs are not recomputed.
     :param S: Current stock price.
     :param K: Option stock price.
     :param T: Time to maturity.
     :param r: Risk-free interest rate as a decimal.
     :param sigma: Volatility of the underlying stock.
-    :return: The call option price.
+    :param dtype: Optional floating dtype for the vectorized computation. np.float32
+        halves memory traffic on large books; keep float64 for deep out-of-the-money
+        options close to expiry, where single precision loses the small prices.
+    :return: The call option price, or a numpy array of prices for array inputs.
     """
+    if (dtype is not None or isinstance(S, _ARRAY_TYPES) or isinstance(K, _ARRAY_TYPES)
+            or isinstance(T, _ARRAY_TYPES) or isinstance(r, _ARRAY_TYPES) or isinstance(sigma, _ARRAY_TYPES)):
+        return _black_scholes_call_arr(S, K, T, r, sigma, dtype)
+
     if S <= 0 or K <= 0:
         raise ValueError("Stock price and strike price must be positive.")
     if T <= 0:
@@ -207,13 +510,101 @@ def black_scholes_call(S, K, T, r, sigma):
         raise ValueError("Risk-free rate cannot be negative.")
     if sigma <= 0:
         raise ValueError("Volatility must be positive.")
+    return _black_scholes_call_scalar(S, K, T, r, sigma)
 
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _black_scholes_call_scalar(S, K, T, r, sigma):
+    """
+    Black-Scholes call price for scalar (hashable) inputs, without validation.
+    :param S: Current stock price.
+    :param K: Option stock price.
+    :param T: Time to maturity.
+    :param r: Risk-free interest rate as a decimal.
+    :param sigma: Volatility of the underlying stock.
+    :return: The call option price.
+    """
     d1 = (log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * sqrt(T))
     d2 = d1 - sigma * sqrt(T)
-    call_price = S * norm.cdf(d1) - K * exp(-r * T) * norm.cdf(d2)
+    call_price = S * _Phi(d1) - K * exp(-r * T) * _Phi(d2)
     return call_price
 
 
+def implied_volatility_call(price, S, K, T, r, tolerance=1e-10, max_iterations=100):
+    """
+    Calculate the Black-Scholes implied volatility of a call option.
+    Starts from the Brenner-Subrahmanyam estimate (or the point of maximum vega
+    away from the money) and refines it with Newton steps on the log price,
+    falling back to bisection whenever a step leaves the bracket known to
+    contain the root. Any argument may be an array.
+    :param price: Observed call option price.
+    :param S: Current stock price.
+    :param K: Option strike price.
+    :param T: Time to maturity.
+    :param r: Risk-free interest rate as a decimal.
+    :param tolerance: Stop once the volatility changes by less than this and the price
+        is matched to a relative 1e-8 (default is 1e-10).
+    :param max_iterations: The maximum number of iterations to perform (default is 100).
+    :return: The implied volatility, or a numpy array of them for array inputs.
+    """
+    scalar = not (isinstance(price, _ARRAY_TYPES) or isinstance(S, _ARRAY_TYPES) or isinstance(K, _ARRAY_TYPES)
+                  or isinstance(T, _ARRAY_TYPES) or isinstance(r, _ARRAY_TYPES))
+    price, S, K, T, r = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (price, S, K, T, r)))
+    if np.any(S <= 0) or np.any(K <= 0):
+        raise ValueError("Stock price and strike price must be positive.")
+    if np.any(T <= 0):
+        raise ValueError("Time to maturity must be positive.")
+    if np.any(r < 0):
+        raise ValueError("Risk-free rate cannot be negative.")
+    if tolerance <= 0:
+        raise ValueError("Tolerance must be a positive number.")
+    if max_iterations <= 0:
+        raise ValueError("Maximum iterations must be a positive integer.")
+
+    discounted_strike = K * np.exp(-r * T)
+    if np.any(price <= np.maximum(S - discounted_strike, 0)) or np.any(price >= S):
+        raise ValueError("Price must lie strictly between the option's intrinsic value and the stock price.")
+
+    from scipy.special import ndtr
+
+    sqrt_t = np.sqrt(T)
+    log_moneyness = np.log(S / K)
+    log_price = np.log(price)
+    # Start from the larger of the Brenner-Subrahmanyam estimate (exact to first order
+    # at the money) and the Manaster-Koehler point sqrt(2|ln(F/K)|/T), where vega peaks.
+    # Away from the money the latter keeps deep out-of-the-money prices from underflowing.
+    sigma = np.maximum(price / S * sqrt(2 * pi) / sqrt_t,
+                       np.sqrt(2 * np.abs(log_moneyness + r * T) / T))
+    # The call price increases with volatility, so every evaluation tightens [lower, upper]
+    lower = np.zeros_like(sigma)
+    upper = np.full_like(sigma, np.inf)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        for i in range(max_iterations):
+            vol = sigma * sqrt_t
+            d1 = (log_moneyness + (r + 0.5 * sigma * sigma) * T) / vol
+            model = S * ndtr(d1) - discounted_strike * ndtr(d1 - vol)
+            vega = S * sqrt_t * np.exp(-0.5 * d1 * d1) / sqrt(2 * pi)
+
+            upper = np.where(model >= price, sigma, upper)
+            lower = np.where(model < price, sigma, lower)
+            # Newton on the log price stays well scaled when the price is many orders of magnitude small
+            log_residual = np.log(model) - log_price
+            newton_step = sigma - log_residual * model / vega
+            # While no upper bound is known, growth is capped at doubling per iteration
+            unbounded = np.isinf(upper)
+            ceiling = np.where(unbounded, 2 * sigma, upper)
+            fallback = np.where(unbounded, 2 * sigma, 0.5 * (lower + upper))
+            new_sigma = np.where((newton_step > lower) & (newton_step < ceiling), newton_step, fallback)
+
+            converged = ~unbounded & (np.abs(new_sigma - sigma) < tolerance) & (np.abs(log_residual) < 1e-8)
+            if np.all(converged):
+                return float(new_sigma) if scalar else new_sigma
+            sigma = new_sigma
+
+    raise ValueError(f"Implied volatility did not converge after {max_iterations} iterations.")
+
+
 def sharpe_ratio(returns, risk_free_rate):
     """
     Calculate the Sharpe Ratio for a series of returns.
@@ -228,8 +619,11 @@ def sharpe_ratio(returns, risk_free_rate):
     if len(returns) == 0:
         raise ValueError("Returns list cannot be empty.")
 
-    mean_return = np.mean(returns)
-    std_dev = np.std(returns)
+    arr = np.ascontiguousarray(returns, dtype=np.float64).ravel()
+    mean_return = arr.sum() / arr.size
+    # Reuse the mean for the (population) standard deviation instead of letting np.std recompute it
+    deviations = arr - mean_return
+    std_dev = np.sqrt(np.dot(deviations, deviations) / arr.size)
     if std_dev == 0:
         raise ValueError("Standard deviation of returns is zero; Sharpe ratio is undefined.")
 
@@ -250,6 +644,7 @@ def value_at_risk(returns, confidence_level):
     if not 0 < confidence_level < 1:
         raise ValueError("Confidence level must be between 0 and 1.")
 
-    sorted_returns = np.sort(returns)
-    index = int((1 - confidence_level) * len(sorted_returns))
-    return abs(sorted_returns[index])
\ No newline at end of file
+    arr = np.asarray(returns).ravel()
+    index = int((1 - confidence_level) * arr.size)
+    # Only the index-th order statistic is needed, so select it in O(n) rather than sorting
+    return abs(np.partition(arr, index)[index])
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from pynance.batch import bs_call_batch, bond_price_batch, _CHUNK_SIZE
+from pynance.myfunctions import black_scholes_call, bond_price
+
+
+class TestBatchFunctions(unittest.TestCase):
+
+    def test_bs_call_batch(self):
+        S = np.linspace(50, 150, 5000)
+        prices = bs_call_batch(S, 100, 1, 0.05, 0.2)
+        self.assertEqual(prices.shape, (5000,))
+        self.assertAlmostEqual(prices[2500], black_scholes_call(S[2500], 100, 1, 0.05, 0.2), places=10)
+        np.testing.assert_allclose(prices, black_scholes_call(S, 100, 1, 0.05, 0.2))
+
+        out = np.empty(5000)
+        self.assertIs(bs_call_batch(S, 100, 1, 0.05, 0.2, out=out), out)
+        self.assertRaises(ValueError, bs_call_batch, S, 100, 1, 0.05, 0.2, out=out, dtype=np.float32)
+        self.assertRaises(ValueError, bs_call_batch, S, 100, 1, 0.05, 0.2, out=np.empty(3))
+        self.assertRaises(ValueError, bs_call_batch, S, 100, 1, 0.05, 0.2, out=np.empty(5000, dtype=np.int64))
+        self.assertRaises(ValueError, bs_call_batch, S, -100, 1, 0.05, 0.2)
+        self.assertRaises(ValueError, bs_call_batch, np.ones((2, 2)), 100, 1, 0.05, 0.2)
+
+        prices32 = bs_call_batch(S, 100, 1, 0.05, 0.2, dtype=np.float32)
+        self.assertEqual(prices32.dtype, np.float32)
+        np.testing.assert_allclose(prices32, prices, rtol=1e-4, atol=1e-4)
+
+    def test_bs_call_batch_chunked(self):
+        # More than two full chunks plus a partial tail
+        n = 2 * _CHUNK_SIZE + 1234
+        S = np.linspace(50, 150, n)
+        sigma = np.linspace(0.1, 0.5, n)
+        prices = bs_call_batch(S, 100, 1, 0.05, sigma)
+        np.testing.assert_allclose(prices, black_scholes_call(S, 100, 1, 0.05, sigma), rtol=1e-12)
+        for i in (0, _CHUNK_SIZE - 1, _CHUNK_SIZE, 2 * _CHUNK_SIZE, n - 1):
+            self.assertAlmostEqual(prices[i], black_scholes_call(S[i], 100, 1, 0.05, sigma[i]), places=10)
+
+    def test_bond_price_batch(self):
+        rates = np.array([0.03, 0.0, 0.05, 1e-14])
+        prices = bond_price_batch(1000, 0.05, 10, rates)
+        for price, rate in zip(prices, rates):
+            self.assertAlmostEqual(price, bond_price(1000, 0.05, 10, rate), places=8)
+        self.assertAlmostEqual(prices[3], 1499.99999999987, places=8)
+
+        periods = np.arange(1, 2001)
+        prices = bond_price_batch(1000, 0.05, periods, 0.03)
+        self.assertAlmostEqual(prices[359], bond_price(1000, 0.05, 360, 0.03), places=8)
+        out = np.empty(2000, dtype=np.float32)
+        self.assertRaises(ValueError, bond_price_batch, 1000, 0.05, periods, 0.03, out=out)
+        self.assertRaises(ValueError, bond_price_batch, 1000, 0.05, 10, -rates)
+        self.assertRaises(ValueError, bond_price_batch, 1000, 0.05, 0, rates)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,9 @@
 import unittest
+import numpy as np
 from pynance.myfunctions import (
     present_value, future_value, npv, npv_derivative, internal_rate_of_return,
     bond_price, yield_to_maturity, dividend_discount_model, black_scholes_call,
-    sharpe_ratio, value_at_risk
+    implied_volatility_call, sharpe_ratio, value_at_risk
 )
 
 
@@ -11,23 +12,33 @@ class TestFinancialFunctions(unittest.TestCase):
     # Time Value of Money (TVM) Functions Tests
     def test_present_value(self):
         self.assertAlmostEqual(present_value(0.05, 1000, 10), 613.91, places=2)
+        np.testing.assert_allclose(present_value(0.05, np.array([1000., 2000.]), 10), [613.91, 1227.83], atol=0.01)
         self.assertRaises(ValueError, present_value, -0.05, 1000, 10)
         self.assertRaises(ValueError, present_value, 0.05, 1000, -10)
 
     def test_future_value(self):
         self.assertAlmostEqual(future_value(0.05, 1000, 10), 1628.89, places=2)
+        np.testing.assert_allclose(future_value(0.05, np.array([1000., 2000.]), 10), [1628.89, 3257.79], atol=0.01)
         self.assertRaises(ValueError, future_value, -0.05, 1000, 10)
         self.assertRaises(ValueError, future_value, 0.05, 1000, -10)
 
     def test_npv(self):
         cash_flows = [-1000, 300, 400, 500, 600]
         self.assertAlmostEqual(npv(0.1, cash_flows), 388.77, places=2)
+        self.assertAlmostEqual(npv(0.1, np.array(cash_flows)), 388.77, places=2)
         self.assertRaises(ValueError, npv, -1.1, cash_flows)
+        self.assertRaises(ValueError, npv, -1, cash_flows)
+        # One column per scenario is valued independently
+        scenarios = np.array([[-2., -1.], [0., 1.], [2., 3.]])
+        np.testing.assert_allclose(npv(0.1, scenarios), [-0.34710744, 2.38842975])
+        np.testing.assert_allclose(npv(0.1, list(scenarios)), [-0.34710744, 2.38842975])
         self.assertRaises(TypeError, npv, 0.1, "invalid input")
 
     def test_npv_derivative(self):
         cash_flows = [-1000, 300, 400, 500, 600]
         self.assertAlmostEqual(npv_derivative(0.1, cash_flows), -3363.72, places=2)
+        scenarios = np.array([[-2., -1.], [0., 1.], [2., 3.]])
+        np.testing.assert_allclose(npv_derivative(0.1, scenarios), [-3.0052592, -5.33433509])
         self.assertRaises(ValueError, npv_derivative, -1.1, cash_flows)
         self.assertRaises(TypeError, npv_derivative, 0.1, "invalid input")
 
@@ -35,13 +46,34 @@ class TestFinancialFunctions(unittest.TestCase):
         cash_flows = [-1000, 300, 400, 500, 600]
         self.assertAlmostEqual(internal_rate_of_return(cash_flows), 0.2489, places=4)
         self.assertRaises(TypeError, internal_rate_of_return, "invalid input")
+        self.assertRaises(ValueError, internal_rate_of_return, np.array([[-1000, -500], [600, 300], [600, 400]]))
         self.assertRaises(ValueError, internal_rate_of_return, cash_flows, initial_guess=-2)
         self.assertRaises(ValueError, internal_rate_of_return, cash_flows, tolerance=-0.01)
         self.assertRaises(ValueError, internal_rate_of_return, cash_flows, max_iterations=0)
 
+    def test_npv_short_and_long_cash_flows(self):
+        # Short lists use generated Horner kernels, longer ones and ndarrays the vectorized path
+        for n in (0, 1, 2, 60, 64, 65, 200):
+            cash_flows = [-1000.0] + [37.5 + t for t in range(n - 1)] if n else []
+            expected = sum(cf / 1.07 ** t for t, cf in enumerate(cash_flows))
+            expected_deriv = sum(-t * cf / 1.07 ** (t + 1) for t, cf in enumerate(cash_flows))
+            self.assertAlmostEqual(npv(0.07, cash_flows), expected, places=8)
+            self.assertAlmostEqual(npv(0.07, np.array(cash_flows)), expected, places=8)
+            self.assertAlmostEqual(npv_derivative(0.07, cash_flows), expected_deriv, places=6)
+            self.assertAlmostEqual(npv_derivative(0.07, np.array(cash_flows)), expected_deriv, places=6)
+
+        for n in (64, 65, 500):
+            cash_flows = [-1000.0] + [100.0] * (n - 1)
+            irr = internal_rate_of_return(cash_flows)
+            self.assertAlmostEqual(irr, internal_rate_of_return(np.array(cash_flows)), places=10)
+            self.assertAlmostEqual(npv(irr, cash_flows), 0, places=6)
+
     # Bond Pricing and Yield Calculations Tests
     def test_bond_price(self):
         self.assertAlmostEqual(bond_price(1000, 0.05, 10, 0.03), 1170.60, places=2)
+        self.assertAlmostEqual(bond_price(1000, 0.05, 10, 0), 1500.00, places=2)
+        self.assertAlmostEqual(bond_price(1000, 0.05, 10, 1e-14), 1499.99999999987, places=8)
+        np.testing.assert_allclose(bond_price(1000, 0.05, 10, np.array([0.03])), [1170.60], atol=0.01)
         self.assertRaises(ValueError, bond_price, -1000, 0.05, 10, 0.03)
         self.assertRaises(ValueError, bond_price, 1000, -0.05, 10, 0.03)
         self.assertRaises(ValueError, bond_price, 1000, 0.05, -10, 0.03)
@@ -49,6 +81,10 @@ class TestFinancialFunctions(unittest.TestCase):
 
     def test_yield_to_maturity(self):
         self.assertAlmostEqual(yield_to_maturity(1000, 0.05, 10, 900), 0.0638, places=4)
+        self.assertAlmostEqual(yield_to_maturity(1000, 0.05, 10, 1600), -0.0075, places=4)
+        self.assertAlmostEqual(yield_to_maturity(1000, 0.05, 10, 1499.99999) / 7.8431e-10, 1, places=4)
+        # Steep price curve deep in negative yields, where unguarded Newton steps crawl
+        self.assertAlmostEqual(yield_to_maturity(1000, 0.01, 30, 258495.0174), -0.1674288049, places=9)
         self.assertRaises(ValueError, yield_to_maturity, -1000, 0.05, 10, 900)
         self.assertRaises(ValueError, yield_to_maturity, 1000, -0.05, 10, 900)
         self.assertRaises(ValueError, yield_to_maturity, 1000, 0.05, -10, 900)
@@ -70,10 +106,41 @@ class TestFinancialFunctions(unittest.TestCase):
         self.assertRaises(ValueError, black_scholes_call, 100, 100, 1, -0.05, 0.2)
         self.assertRaises(ValueError, black_scholes_call, 100, 100, 1, 0.05, -0.2)
 
+    def test_black_scholes_call_vectorized(self):
+        prices = black_scholes_call(np.array([100, 110]), 100, 1, 0.05, np.array([0.2, 0.3]))
+        self.assertEqual(prices.shape, (2,))
+        self.assertAlmostEqual(prices[0], 10.45, places=2)
+        self.assertAlmostEqual(prices[1], black_scholes_call(110, 100, 1, 0.05, 0.3), places=10)
+        self.assertRaises(ValueError, black_scholes_call, np.array([100, -100]), 100, 1, 0.05, 0.2)
+        self.assertRaises(ValueError, black_scholes_call, 100, 100, 1, 0.05, np.array([0.2, 0.0]))
+        prices32 = black_scholes_call(np.array([100, 110]), 100, 1, 0.05, np.array([0.2, 0.3]), dtype=np.float32)
+        self.assertEqual(prices32.dtype, np.float32)
+        np.testing.assert_allclose(prices32, prices, rtol=1e-5)
+
+    def test_implied_volatility_call(self):
+        price = black_scholes_call(100, 100, 1, 0.05, 0.2)
+        self.assertAlmostEqual(implied_volatility_call(price, 100, 100, 1, 0.05), 0.2, places=8)
+        strikes = np.array([60, 100, 150])
+        vols = np.array([0.15, 0.3, 0.6])
+        prices = black_scholes_call(100, strikes, 2, 0.03, vols)
+        np.testing.assert_allclose(implied_volatility_call(prices, 100, strikes, 2, 0.03), vols)
+        # Deep out of the money, including prices many orders of magnitude below one
+        self.assertAlmostEqual(implied_volatility_call(black_scholes_call(100, 200, 0.1, 0, 0.1), 100, 200, 0.1, 0),
+                               0.1, places=8)
+        self.assertAlmostEqual(implied_volatility_call(black_scholes_call(100, 300, 1, 0, 0.2), 100, 300, 1, 0),
+                               0.2, places=8)
+        otm_strikes = np.array([150, 250, 400])
+        otm_prices = black_scholes_call(100, otm_strikes, 0.5, 0.01, 0.25)
+        np.testing.assert_allclose(implied_volatility_call(otm_prices, 100, otm_strikes, 0.5, 0.01), 0.25)
+        self.assertRaises(ValueError, implied_volatility_call, 101, 100, 100, 1, 0.05)
+        self.assertRaises(ValueError, implied_volatility_call, 1, 100, 50, 1, 0.05)
+        self.assertRaises(ValueError, implied_volatility_call, price, 100, 100, -1, 0.05)
+
     # Risk and Performance Metrics Tests
     def test_sharpe_ratio(self):
         returns = [0.05, 0.1, 0.15, 0.1, 0.05]
         self.assertAlmostEqual(sharpe_ratio(returns, 0.02), 1.8708, places=4)
+        self.assertAlmostEqual(sharpe_ratio([[0.05, 0.1], [0.15, 0.1]], 0.02), 2.2627, places=4)
         self.assertRaises(TypeError, sharpe_ratio, "invalid input", 0.02)
         self.assertRaises(ValueError, sharpe_ratio, returns, -0.02)
         self.assertRaises(ValueError, sharpe_ratio, [], 0.02)
@@ -81,6 +148,8 @@ class TestFinancialFunctions(unittest.TestCase):
     def test_value_at_risk(self):
         returns = [-0.02, 0.05, -0.01, 0.04, 0.03]
         self.assertAlmostEqual(value_at_risk(returns, 0.95), 0.02, places=2)
+        # Multi-dimensional returns are pooled into one sample
+        self.assertAlmostEqual(value_at_risk(np.array([[0.1, -0.2, 0.3], [0.05, -0.1, 0.2]]), 0.5), 0.1)
         self.assertRaises(TypeError, value_at_risk, "invalid input", 0.95)
         self.assertRaises(ValueError, value_at_risk, returns, 1.5)
         self.assertRaises(ValueError, value_at_risk, [], 0.95)